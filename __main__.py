@@ -1,3 +1,4 @@
+import contextlib
 import logging
 import os
 
@@ -5,6 +6,7 @@ import click
 import uvicorn  
 from openai_agent import create_agent  # type: ignore[import-not-found] 
 from openai_agent_executor import OpenAIAgentExecutor  # type: ignore[import-untyped]
+from github_toolset import close_client  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 from starlette.applications import Starlette
 
@@ -23,6 +25,15 @@ load_dotenv()
 logging.basicConfig()
 
 
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+    yield
+    # Release the pooled GitHub and task store connections on shutdown
+    await close_client()
+    if hasattr(app.state.task_store, 'aclose'):
+        await app.state.task_store.aclose()
+
+
 @click.command()
 @click.option('--host', 'host', default='localhost')
 @click.option('--port', 'port', default=10007)
@@ -65,8 +76,22 @@ def main(host: str, port: int):
         api_key=os.getenv('OPENROUTER_API_KEY')
     )
 
+    # Keep tasks in Redis when configured, so they survive restarts
+    redis_url = os.getenv('REDIS_URL')
+    if redis_url:
+        from redis_task_store import DEFAULT_TASK_TTL_SECONDS, RedisTaskStore  # type: ignore[import-untyped]
+        # 0 keeps tasks until they are deleted
+        ttl_seconds = int(os.getenv('REDIS_TASK_TTL_SECONDS', DEFAULT_TASK_TTL_SECONDS))
+        if ttl_seconds < 0:
+            raise ValueError(
+                'REDIS_TASK_TTL_SECONDS must be 0 or a positive number of seconds'
+            )
+        task_store = RedisTaskStore.from_url(redis_url, ttl_seconds=ttl_seconds or None)
+    else:
+        task_store = InMemoryTaskStore()
+
     request_handler = DefaultRequestHandler(
-        agent_executor=agent_executor, task_store=InMemoryTaskStore()
+        agent_executor=agent_executor, task_store=task_store
     )
 
     a2a_app = A2AStarletteApplication(
@@ -74,9 +99,11 @@ def main(host: str, port: int):
     )
     routes = a2a_app.routes()
     
-    app = Starlette(routes=routes)
+    app = Starlette(routes=routes, lifespan=lifespan)
+    app.state.task_store = task_store
 
-    uvicorn.run(app, host=host, port=port)
+    # Single worker: event queues for streaming are held in process memory
+    uvicorn.run(app, host=host, port=port, loop='auto', http='auto')
 
 
 if __name__ == '__main__':
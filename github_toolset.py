@@ -1,32 +1,239 @@
+import asyncio
+import functools
+import hashlib
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 
-from github import Github, Auth
-from pydantic import BaseModel
+import ciso8601
+import httpx
+import msgspec
+from cachetools import LRUCache, TTLCache
 
 
-class GitHubUser(BaseModel):
-    """GitHub user information"""
-    login: str
-    name: Optional[str] = None
-    email: Optional[str] = None
+GITHUB_API_URL = 'https://api.github.com'
 
+# GitHub serves at most this many items per page, and each tool fetches a single page
+MAX_PAGE_SIZE = 100
 
-class GitHubRepository(BaseModel):
+# Responses are served from memory for this long, then revalidated with their ETag
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_SIZE = 512
+
+
+class _CachedResponse(NamedTuple):
+    """Decoded GitHub response body with its ETag"""
+    etag: Optional[str]
+    body: Any
+
+
+# Shared across toolset instances; keys include the caller's token fingerprint.
+# Fresh bodies, dropped once CACHE_TTL_SECONDS have passed
+_fresh_cache: TTLCache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS, timer=time.monotonic)
+# Last known body and ETag per key, kept past expiry for revalidation and as a
+# fallback while rate limited
+_etag_cache: LRUCache = LRUCache(maxsize=CACHE_MAX_SIZE)
+
+# Fetches currently on the wire, so identical concurrent requests share one round-trip
+_inflight: Dict[Tuple[Any, ...], 'asyncio.Task[Any]'] = {}
+
+# Longest a request waits for an exhausted rate limit to reset before failing fast
+RATE_LIMIT_MAX_WAIT_SECONDS = 30
+
+# Per X-RateLimit-Resource bucket ('core', 'search', ...): a gate that is cleared while
+# GitHub reports no requests left and set again at the reset time, and that reset time
+_rate_gates: Dict[str, asyncio.Event] = {}
+_rate_limit_resets: Dict[str, float] = {}
+
+
+@functools.cache
+def get_client() -> httpx.AsyncClient:
+    """Get the shared GitHub API client, created on first use"""
+    headers = {
+        'Accept': 'application/vnd.github+json',
+        'X-GitHub-Api-Version': '2022-11-28',
+    }
+    github_token = os.getenv('GITHUB_TOKEN')
+    if github_token:
+        headers['Authorization'] = f'Bearer {github_token}'
+    else:
+        # Use without authentication (limited rate)
+        print("Warning: No GITHUB_TOKEN found, using unauthenticated access (limited rate)")
+    return httpx.AsyncClient(
+        base_url=GITHUB_API_URL,
+        headers=headers,
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=30.0,
+    )
+
+
+async def close_client() -> None:
+    """Close the shared GitHub API client if it was created"""
+    if get_client.cache_info().currsize:
+        await get_client().aclose()
+        get_client.cache_clear()
+
+
+@functools.cache
+def _auth_id() -> str:
+    """Fingerprint of the shared client's credentials, used in cache keys"""
+    authorization = get_client().headers.get('Authorization', '')
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+async def _get_json(
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    cache_params: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Issue a GET request against the GitHub REST API and return the decoded JSON body
+    
+    Bodies are cached for CACHE_TTL_SECONDS. Once expired, the request is sent with
+    If-None-Match so an unchanged resource costs a 304 instead of a full download.
+    Concurrent callers asking for the same key await a single shared fetch.
+    
+    Args:
+        path: API path, relative to GITHUB_API_URL
+        params: Query parameters
+        cache_params: Used in place of params to build the cache key, for queries
+            whose parameters shift on every call (such as a 'since' timestamp)
+    """
+    key_params = params if cache_params is None else cache_params
+    key = (path, tuple(sorted((key_params or {}).items())), _auth_id())
+    body = _fresh_cache.get(key)
+    if body is not None:
+        return body
+    
+    cached = _etag_cache.get(key)
+    fetch = _inflight.get(key)
+    if fetch is None:
+        fetch = asyncio.ensure_future(_fetch_json(key, path, params, cached))
+        _inflight[key] = fetch
+        fetch.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one cancelled caller does not abort the fetch for the others
+    return await asyncio.shield(fetch)
+
+
+async def _fetch_json(
+    key: Tuple[Any, ...],
+    path: str,
+    params: Optional[Dict[str, Any]],
+    cached: Optional[_CachedResponse],
+) -> Any:
+    """Fetch a GitHub resource, revalidating the last known response, and cache the result"""
+    resource = _rate_limit_resource(path)
+    if not _rate_gate(resource).is_set():
+        # A stale answer beats waiting out the rate limit
+        if cached is not None:
+            return cached.body
+        await _wait_for_rate_limit_reset(resource)
+    
+    headers = {}
+    if cached is not None and cached.etag:
+        headers['If-None-Match'] = cached.etag
+    
+    response = await get_client().get(path, params=params, headers=headers)
+    _track_rate_limit(response)
+    if response.status_code == 304 and cached is not None:
+        _fresh_cache[key] = cached.body
+        return cached.body
+    
+    response.raise_for_status()
+    body = msgspec.json.decode(response.content)
+    _fresh_cache[key] = body
+    _etag_cache[key] = _CachedResponse(etag=response.headers.get('ETag'), body=body)
+    return body
+
+
+def _rate_limit_resource(path: str) -> str:
+    """Name of the GitHub rate-limit bucket that requests to path count against"""
+    return 'search' if path.startswith('/search/') else 'core'
+
+
+def _rate_gate(resource: str) -> asyncio.Event:
+    """Get the rate gate for a rate-limit bucket, open until GitHub reports it exhausted"""
+    gate = _rate_gates.get(resource)
+    if gate is None:
+        gate = _rate_gates[resource] = asyncio.Event()
+        gate.set()
+    return gate
+
+
+def _track_rate_limit(response: httpx.Response) -> None:
+    """Close the response's rate gate until the reset time once GitHub reports no requests left"""
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    resource = response.headers.get('X-RateLimit-Resource', 'core')
+    gate = _rate_gate(resource)
+    if remaining is None or int(remaining) > 0 or not gate.is_set():
+        return
+    
+    reset_at = float(response.headers.get('X-RateLimit-Reset', 0))
+    _rate_limit_resets[resource] = reset_at
+    gate.clear()
+    asyncio.get_running_loop().call_later(max(reset_at - time.time(), 0), gate.set)
+
+
+async def _wait_for_rate_limit_reset(resource: str) -> None:
+    """Wait for a rate gate to reopen, failing fast if the reset is beyond RATE_LIMIT_MAX_WAIT_SECONDS"""
+    reset_at = _rate_limit_resets[resource]
+    if reset_at - time.time() <= RATE_LIMIT_MAX_WAIT_SECONDS:
+        try:
+            await asyncio.wait_for(_rate_gate(resource).wait(), timeout=RATE_LIMIT_MAX_WAIT_SECONDS)
+            return
+        except asyncio.TimeoutError:
+            pass
+    
+    reset_time = datetime.fromtimestamp(reset_at, timezone.utc)
+    raise RuntimeError(f'GitHub API rate limit exceeded, resets at {reset_time:%Y-%m-%dT%H:%M:%SZ}')
+
+
+def _page_size(limit: int) -> int:
+    """Validate a tool's limit and clamp it to a single page of results"""
+    if limit <= 0:
+        raise ValueError('limit must be a positive integer')
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _limit_note(limit: int) -> str:
+    """Suffix for a tool's result message when its limit was clamped"""
+    return f' (limit capped at {MAX_PAGE_SIZE})' if limit > MAX_PAGE_SIZE else ''
+
+
+class GitHubRepository(msgspec.Struct):
     """GitHub repository information"""
     name: str
     full_name: str
-    description: Optional[str] = None
+    description: Optional[str]
     url: str
     updated_at: str
-    pushed_at: str
-    language: Optional[str] = None
+    pushed_at: Optional[str]
+    language: Optional[str]
     stars: int
     forks: int
-    
-    
-class GitHubCommit(BaseModel):
+
+
+# GitHubRepository field -> key in the GitHub REST repository payload
+_REPOSITORY_FIELDS = (
+    ('name', 'name'),
+    ('full_name', 'full_name'),
+    ('description', 'description'),
+    ('url', 'html_url'),
+    ('updated_at', 'updated_at'),
+    ('pushed_at', 'pushed_at'),
+    ('language', 'language'),
+    ('stars', 'stargazers_count'),
+    ('forks', 'forks_count'),
+)
+
+
+def _to_repository(repo: Dict[str, Any]) -> GitHubRepository:
+    """Build a GitHubRepository from a raw repository payload"""
+    return GitHubRepository(**{field: repo.get(key) for field, key in _REPOSITORY_FIELDS})
+
+
+class GitHubCommit(msgspec.Struct):
     """GitHub commit information"""
     sha: str
     message: str
@@ -38,28 +245,12 @@ class GitHubCommit(BaseModel):
 class GitHubToolset:
     """GitHub API toolset for querying repositories and recent updates"""
     
-    def __init__(self):
-        self._github_client = None
-    
-    def _get_github_client(self) -> Github:
-        """Get GitHub client with authentication"""
-        if self._github_client is None:
-            github_token = os.getenv('GITHUB_TOKEN')
-            if github_token:
-                auth = Auth.Token(github_token)
-                self._github_client = Github(auth=auth)
-            else:
-                # Use without authentication (limited rate)
-                print("Warning: No GITHUB_TOKEN found, using unauthenticated access (limited rate)")
-                self._github_client = Github()
-        return self._github_client
-    
-    def get_user_repositories(self, username: Optional[str] = None, days: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    async def get_user_repositories(self, username: Optional[str] = None, days: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, Any]:
         """Get user's repositories with recent updates
         Args:
             username: GitHub username (optional, defaults to authenticated user)
             days: Number of days to look for recent updates (default: 30 days)
-            limit: Maximum number of repositories to return (default: 10)
+            limit: Maximum number of repositories to return (default: 10, at most 100)
             
         Returns:
             dict: Contains status ('success' or 'error') and repository list or error message.
@@ -71,45 +262,41 @@ class GitHubToolset:
             limit = 10
 
         try:
-            github = self._get_github_client()
+            page_size = _page_size(limit)
             
             if username:
-                user = github.get_user(username)
+                path = f'/users/{username}/repos'
+            elif 'Authorization' in get_client().headers:
+                path = '/user/repos'
             else:
-                try:
-                    user = github.get_user()
-                except Exception:
-                    # If no token, we can't get authenticated user, so require username
-                    return {
-                        'status': 'error',
-                        'error_message': 'Username is required when not using authentication token'
-                    }
+                # If no token, we can't get authenticated user, so require username
+                return {
+                    'status': 'error',
+                    'error_message': 'Username is required when not using authentication token'
+                }
             
             repos = []
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+            
+            data = await _get_json(path, params={
+                'sort': 'updated',
+                'direction': 'desc',
+                'per_page': page_size,
+            })
             
-            for repo in user.get_repos(sort='updated', direction='desc'):
-                if len(repos) >= limit:
+            # The list is sorted by update time, so the first repository older
+            # than the cutoff ends the scan.
+            for repo in data[:page_size]:
+                if ciso8601.parse_datetime(repo['updated_at']) < cutoff_date:
                     break
                     
-                if repo.updated_at >= cutoff_date:
-                    repos.append({
-                        'name': repo.name,
-                        'full_name': repo.full_name,
-                        'description': repo.description,
-                        'url': repo.html_url,
-                        'updated_at': repo.updated_at.isoformat(),
-                        'pushed_at': repo.pushed_at.isoformat() if repo.pushed_at else None,
-                        'language': repo.language,
-                        'stars': repo.stargazers_count,
-                        'forks': repo.forks_count
-                    })
+                repos.append(_to_repository(repo))
             
             return {
                 'status': 'success',
                 'data': repos,
                 'count': len(repos),
-                'message': f'Successfully retrieved {len(repos)} repositories updated in the last {days} days'
+                'message': f'Successfully retrieved {len(repos)} repositories updated in the last {days} days{_limit_note(limit)}'
             }
         except Exception as e:
             return {
@@ -117,13 +304,13 @@ class GitHubToolset:
                 'error_message': f'Failed to get repositories: {str(e)}'
             }
     
-    def get_recent_commits(self, repo_name: str, days: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    async def get_recent_commits(self, repo_name: str, days: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, Any]:
         """Get recent commits for a repository
         
         Args:
             repo_name: Repository name in format 'owner/repo'
             days: Number of days to look for recent commits (default: 7 days)
-            limit: Maximum number of commits to return (default: 10)
+            limit: Maximum number of commits to return (default: 10, at most 100)
             
         Returns:
             dict: Contains status ('success' or 'error') and commit list or error message.
@@ -135,29 +322,35 @@ class GitHubToolset:
             limit = 10
             
         try:
-            github = self._get_github_client()
-            
-            repo = github.get_repo(repo_name)
+            page_size = _page_size(limit)
             commits = []
-            cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
             
-            for commit in repo.get_commits(since=cutoff_date):
-                if len(commits) >= limit:
-                    break
-                    
-                commits.append({
-                    'sha': commit.sha[:8],
-                    'message': commit.commit.message.split('\n')[0],  # Only take the first line
-                    'author': commit.commit.author.name,
-                    'date': commit.commit.author.date.isoformat(),
-                    'url': commit.html_url
-                })
+            # Keyed on days rather than the moving 'since' timestamp, so repeated
+            # queries hit the cache and ETag revalidation
+            data = await _get_json(
+                f'/repos/{repo_name}/commits',
+                params={
+                    'since': cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'per_page': page_size,
+                },
+                cache_params={'days': days, 'per_page': page_size},
+            )
+            
+            for commit in data[:page_size]:
+                commits.append(GitHubCommit(
+                    sha=commit['sha'][:8],
+                    message=commit['commit']['message'].partition('\n')[0],  # Only take the first line
+                    author=commit['commit']['author']['name'],
+                    date=commit['commit']['author']['date'],
+                    url=commit['html_url'],
+                ))
             
             return {
                 'status': 'success',
                 'data': commits,
                 'count': len(commits),
-                'message': f'Successfully retrieved {len(commits)} commits for repository {repo_name} in the last {days} days'
+                'message': f'Successfully retrieved {len(commits)} commits for repository {repo_name} in the last {days} days{_limit_note(limit)}'
             }
         except Exception as e:
             return {
@@ -165,13 +358,13 @@ class GitHubToolset:
                 'error_message': f'Failed to get commits: {str(e)}'
             }
     
-    def search_repositories(self, query: str, sort: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    async def search_repositories(self, query: str, sort: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
         """Search for repositories with recent activity
         
         Args:
             query: Search query string
             sort: Sorting method, optional values: 'updated', 'stars', 'forks' (default: 'updated')
-            limit: Maximum number of repositories to return (default: 10)
+            limit: Maximum number of repositories to return (default: 10, at most 100)
             
         Returns:
             dict: Contains status ('success' or 'error') and search results or error message.
@@ -183,32 +376,27 @@ class GitHubToolset:
             limit = 10
             
         try:
-            github = self._get_github_client()
+            page_size = _page_size(limit)
             
             # Add recent activity filter to query
-            search_query = f"{query} pushed:>={datetime.now() - timedelta(days=30):%Y-%m-%d}"
+            search_query = f"{query} pushed:>={datetime.now(timezone.utc) - timedelta(days=30):%Y-%m-%d}"
             
             repos = []
-            results = github.search_repositories(query=search_query, sort=sort, order='desc')
-            
-            for repo in results[:limit]:
-                repos.append({
-                    'name': repo.name,
-                    'full_name': repo.full_name,
-                    'description': repo.description,
-                    'url': repo.html_url,
-                    'updated_at': repo.updated_at.isoformat(),
-                    'pushed_at': repo.pushed_at.isoformat() if repo.pushed_at else None,
-                    'language': repo.language,
-                    'stars': repo.stargazers_count,
-                    'forks': repo.forks_count
-                })
+            results = await _get_json('/search/repositories', params={
+                'q': search_query,
+                'sort': sort,
+                'order': 'desc',
+                'per_page': page_size,
+            })
+            
+            for repo in results['items'][:page_size]:
+                repos.append(_to_repository(repo))
             
             return {
                 'status': 'success',
                 'data': repos,
                 'count': len(repos),
-                'message': f'Successfully searched for {len(repos)} repositories matching "{query}"'
+                'message': f'Successfully searched for {len(repos)} repositories matching "{query}"{_limit_note(limit)}'
             }
         except Exception as e:
             return {
@@ -1,8 +1,14 @@
+import asyncio
+import functools
 import json
 import logging
-from typing import Dict, Any
+import time
+from datetime import date
+from typing import Dict, Any, List, Optional, Tuple
 
-from openai import AsyncOpenAI
+import httpx
+import msgspec
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.agent_execution.context import RequestContext
@@ -20,23 +26,25 @@ from a2a.utils.errors import ServerError
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Upper bound on tool calls running at once, to stay under GitHub's secondary rate limits
+MAX_CONCURRENT_TOOL_CALLS = 8
 
-class OpenAIAgentExecutor(AgentExecutor):
-    """An AgentExecutor that runs an OpenAI-based Agent."""
+# Streamed text is forwarded in batches: every status update lands in the task history
+# and is saved to the task store, so one update per token would bloat both
+STREAM_FLUSH_CHARS = 200
+STREAM_FLUSH_INTERVAL_SECONDS = 0.1
 
-    def __init__(self, card: AgentCard, tools: Dict[str, Any], api_key: str):
-        self._card = card
-        self.tools = tools
-        self.client = AsyncOpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1",
-            default_headers={
-                "HTTP-Referer": "http://localhost:10007",
-                "X-Title": "GitHub Agent"
-            }
-        )
-        self.model = "anthropic/claude-3.5-sonnet"
-        self.system_prompt = """You are a GitHub agent that can help users query information about GitHub repositories and recent project updates.
+# Python annotation -> JSON schema type for tool parameters; anything else maps to "string"
+_JSON_SCHEMA_TYPES = {
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+SYSTEM_PROMPT_TEMPLATE = """You are a GitHub agent that can help users query information about GitHub repositories and recent project updates.
+Today's date is {today}.
 
 Users will request information about:
 - Recent updates to their repositories
@@ -55,6 +63,38 @@ When displaying repository information, include relevant details like:
 
 Always provide helpful and accurate information based on the GitHub API results."""
 
+
+@functools.lru_cache(maxsize=1)
+def _render_system_prompt(today: str) -> str:
+    """Render the system prompt for the given ISO date, reused until the date changes"""
+    return SYSTEM_PROMPT_TEMPLATE.format(today=today)
+
+
+class OpenAIAgentExecutor(AgentExecutor):
+    """An AgentExecutor that runs an OpenAI-based Agent."""
+
+    def __init__(self, card: AgentCard, tools: Dict[str, Any], api_key: str):
+        self._card = card
+        self.tools = tools
+        self._tool_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url="https://openrouter.ai/api/v1",
+            default_headers={
+                "HTTP-Referer": "http://localhost:10007",
+                "X-Title": "GitHub Agent"
+            },
+            # Keep warm HTTP/2 connections to OpenRouter across turns and requests
+            http_client=DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=16),
+                timeout=60.0,
+            ),
+        )
+        self.model = "anthropic/claude-3.5-sonnet"
+        # Tool schemas depend only on the tool signatures, so build them once
+        self._openai_tools = self._build_openai_tools()
+
     async def _process_request(
         self,
         message_text: str,
@@ -62,22 +102,10 @@ Always provide helpful and accurate information based on the GitHub API results.
         task_updater: TaskUpdater,
     ) -> None:
         messages = [
-            {"role": "system", "content": self.system_prompt},
+            {"role": "system", "content": _render_system_prompt(date.today().isoformat())},
             {"role": "user", "content": message_text}
         ]
         
-        # Convert tools to OpenAI format
-        openai_tools = []
-        for tool_name, tool_instance in self.tools.items():
-            if hasattr(tool_instance, tool_name):
-                func = getattr(tool_instance, tool_name)
-                # Extract function schema from the method
-                schema = self._extract_function_schema(func)
-                openai_tools.append({
-                    "type": "function",
-                    "function": schema
-                })
-        
         max_iterations = 10
         iteration = 0
         
@@ -85,52 +113,23 @@ Always provide helpful and accurate information based on the GitHub API results.
             iteration += 1
             
             try:
-                # Make API call to OpenAI
-                response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    tools=openai_tools if openai_tools else None,
-                    tool_choice="auto" if openai_tools else None,
-                    temperature=0.1,
-                    max_tokens=4000
-                )
-                
-                message = response.choices[0].message
+                # Make API call to OpenAI, streaming text to the client as it arrives
+                content, tool_calls = await self._stream_completion(messages, task_updater)
                 
                 # Add assistant's response to messages
                 messages.append({
                     "role": "assistant",
-                    "content": message.content,
-                    "tool_calls": message.tool_calls
+                    "content": content,
+                    "tool_calls": tool_calls or None
                 })
                 
                 # Check if there are tool calls to execute
-                if message.tool_calls:
-                    # Execute tool calls
-                    for tool_call in message.tool_calls:
-                        function_name = tool_call.function.name
-                        function_args = json.loads(tool_call.function.arguments)
-                        
-                        logger.debug(f'Calling function: {function_name} with args: {function_args}')
-                        
-                        # Execute the function
-                        if function_name in self.tools:
-                            tool_instance = self.tools[function_name]
-                            # Get the method from the instance
-                            if hasattr(tool_instance, function_name):
-                                method = getattr(tool_instance, function_name)
-                                result = method(**function_args)
-                            else:
-                                result = {"error": f"Method {function_name} not found on tool instance"}
-                        else:
-                            result = {"error": f"Function {function_name} not found"}
-                        
-                        # Add tool result to messages
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "content": json.dumps(result)
-                        })
+                if tool_calls:
+                    # Execute independent tool calls concurrently; results keep the call order
+                    tool_messages = await asyncio.gather(
+                        *(self._execute_tool_call(tool_call) for tool_call in tool_calls)
+                    )
+                    messages.extend(tool_messages)
                     
                     # Send update to show we're processing
                     await task_updater.update_status(
@@ -142,8 +141,8 @@ Always provide helpful and accurate information based on the GitHub API results.
                     continue
                 else:
                     # No more tool calls, this is the final response
-                    if message.content:
-                        parts = [TextPart(text=message.content)]
+                    if content:
+                        parts = [TextPart(text=content)]
                         logger.debug(f'Yielding final response: {parts}')
                         await task_updater.add_artifact(parts)
                         await task_updater.complete()
@@ -161,6 +160,118 @@ Always provide helpful and accurate information based on the GitHub API results.
             await task_updater.add_artifact(error_parts)
             await task_updater.complete()
 
+    async def _stream_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        task_updater: TaskUpdater,
+    ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """Stream one chat completion, forwarding batched text deltas as working status updates
+        
+        Returns:
+            tuple: The full response text (or None) and the tool calls assembled from the deltas.
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            tools=self._openai_tools if self._openai_tools else None,
+            tool_choice="auto" if self._openai_tools else None,
+            temperature=0.1,
+            max_tokens=4000,
+            stream=True
+        )
+        
+        content_parts = []
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        # Index into content_parts of the first delta not yet sent to the client
+        flushed = 0
+        pending_chars = 0
+        last_flush = time.monotonic()
+        
+        async def flush() -> None:
+            nonlocal flushed, pending_chars, last_flush
+            if flushed == len(content_parts):
+                return
+            text = ''.join(content_parts[flushed:])
+            flushed = len(content_parts)
+            pending_chars = 0
+            last_flush = time.monotonic()
+            # The text is already a plain str, so skip validation
+            await task_updater.update_status(
+                TaskState.working,
+                message=task_updater.new_agent_message([TextPart.model_construct(text=text)]),
+            )
+        
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            
+            if delta.content:
+                content_parts.append(delta.content)
+                pending_chars += len(delta.content)
+                if (pending_chars >= STREAM_FLUSH_CHARS
+                        or time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS):
+                    await flush()
+            
+            # Tool call names and arguments arrive in fragments keyed by index
+            for tool_call_delta in delta.tool_calls or ():
+                tool_call = tool_calls.setdefault(tool_call_delta.index, {
+                    "id": None,
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""}
+                })
+                if tool_call_delta.id:
+                    tool_call["id"] = tool_call_delta.id
+                if tool_call_delta.function:
+                    if tool_call_delta.function.name:
+                        tool_call["function"]["name"] += tool_call_delta.function.name
+                    if tool_call_delta.function.arguments:
+                        tool_call["function"]["arguments"] += tool_call_delta.function.arguments
+        
+        await flush()
+        content = ''.join(content_parts) or None
+        return content, [tool_calls[index] for index in sorted(tool_calls)]
+
+    async def _execute_tool_call(self, tool_call: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single tool call and return the tool message for the conversation"""
+        function_name = tool_call["function"]["name"]
+        function_args = json.loads(tool_call["function"]["arguments"] or "{}")
+        
+        logger.debug(f'Calling function: {function_name} with args: {function_args}')
+        
+        # Execute the function
+        if function_name in self.tools:
+            tool_instance = self.tools[function_name]
+            # Get the method from the instance
+            if hasattr(tool_instance, function_name):
+                method = getattr(tool_instance, function_name)
+                async with self._tool_semaphore:
+                    result = await method(**function_args)
+            else:
+                result = {"error": f"Method {function_name} not found on tool instance"}
+        else:
+            result = {"error": f"Function {function_name} not found"}
+        
+        return {
+            "role": "tool",
+            "tool_call_id": tool_call["id"],
+            "content": msgspec.json.encode(result).decode()
+        }
+
+    def _build_openai_tools(self) -> List[Dict[str, Any]]:
+        """Convert tools to OpenAI function calling format"""
+        openai_tools = []
+        for tool_name, tool_instance in self.tools.items():
+            if hasattr(tool_instance, tool_name):
+                func = getattr(tool_instance, tool_name)
+                # Extract function schema from the method
+                schema = self._extract_function_schema(func)
+                openai_tools.append({
+                    "type": "function",
+                    "function": schema
+                })
+        return openai_tools
+
     def _extract_function_schema(self, func):
         """Extract OpenAI function schema from a Python function"""
         import inspect
@@ -180,22 +291,10 @@ Always provide helpful and accurate information based on the GitHub API results.
         required = []
         
         for param_name, param in sig.parameters.items():
-            param_type = "string"  # Default type
+            # Infer type from annotation
+            param_type = _JSON_SCHEMA_TYPES.get(param.annotation, "string")
             param_description = f"Parameter {param_name}"
             
-            # Try to infer type from annotation
-            if param.annotation != inspect.Parameter.empty:
-                if param.annotation == int:
-                    param_type = "integer"
-                elif param.annotation == float:
-                    param_type = "number"
-                elif param.annotation == bool:
-                    param_type = "boolean"
-                elif param.annotation == list:
-                    param_type = "array"
-                elif param.annotation == dict:
-                    param_type = "object"
-            
             # Check if parameter has default value
             if param.default == inspect.Parameter.empty:
                 required.append(param_name)
@@ -227,11 +326,10 @@ Always provide helpful and accurate information based on the GitHub API results.
             await updater.submit()
         await updater.start_work()
         
-        # Extract text from message parts
-        message_text = ""
-        for part in context.message.parts:
-            if isinstance(part.root, TextPart):
-                message_text += part.root.text
+        # Extract text from message parts in a single pass
+        message_text = ''.join(
+            part.root.text for part in context.message.parts if isinstance(part.root, TextPart)
+        )
         
         await self._process_request(message_text, context, updater)
         logger.debug('[GitHub Agent] execute exiting')
@@ -0,0 +1,55 @@
+import logging
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from a2a.server.tasks import TaskStore
+from a2a.types import Task
+
+
+logger = logging.getLogger(__name__)
+
+# Tasks expire a day after their last update unless told otherwise
+DEFAULT_TASK_TTL_SECONDS = 24 * 60 * 60
+
+
+class RedisTaskStore(TaskStore):
+    """A TaskStore that keeps tasks in Redis, so they outlive the server process."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        key_prefix: str = 'a2a:task:',
+        ttl_seconds: Optional[int] = DEFAULT_TASK_TTL_SECONDS,
+    ):
+        self._redis = redis
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisTaskStore':
+        """Create a store backed by a Redis connection pool for the given URL"""
+        return cls(Redis.from_url(url), **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the underlying Redis connection pool"""
+        await self._redis.aclose()
+
+    def _key(self, task_id: str) -> str:
+        return f'{self._key_prefix}{task_id}'
+
+    async def save(self, task: Task) -> None:
+        """Saves or updates a task in the store."""
+        await self._redis.set(self._key(task.id), task.model_dump_json(), ex=self._ttl_seconds)
+        logger.debug(f'Task {task.id} saved to Redis')
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        """Retrieves a task from the store by ID."""
+        data = await self._redis.get(self._key(task_id))
+        if data is None:
+            return None
+        return Task.model_validate_json(data)
+
+    async def delete(self, task_id: str) -> None:
+        """Deletes a task from the store by ID."""
+        await self._redis.delete(self._key(task_id))
@@ -0,0 +1,244 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+import github_toolset
+from github_toolset import GitHubToolset
+
+
+class FakeGitHub:
+    """Records requests and answers them with a configurable handler"""
+
+    def __init__(self):
+        self.requests = []
+        self.handler = lambda request: httpx.Response(200, json={'items': []})
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.handler(request)
+        if asyncio.iscoroutine(response):
+            response = await response
+        return response
+
+
+@pytest.fixture
+def github(monkeypatch):
+    """Route the toolset to a fake GitHub API with empty caches and open rate gates"""
+    fake = FakeGitHub()
+    client = httpx.AsyncClient(
+        base_url=github_toolset.GITHUB_API_URL,
+        headers={'Authorization': 'Bearer test-token'},
+        transport=httpx.MockTransport(fake),
+    )
+    monkeypatch.setattr(github_toolset, 'get_client', lambda: client)
+    github_toolset._auth_id.cache_clear()
+    github_toolset._fresh_cache.clear()
+    github_toolset._etag_cache.clear()
+    github_toolset._inflight.clear()
+    github_toolset._rate_gates.clear()
+    github_toolset._rate_limit_resets.clear()
+    yield fake
+    github_toolset._auth_id.cache_clear()
+
+
+def rate_limited(resource: str, reset_in: float, **kwargs) -> httpx.Response:
+    """A successful response that reports the given rate-limit bucket as exhausted"""
+    headers = {
+        'X-RateLimit-Remaining': '0',
+        'X-RateLimit-Resource': resource,
+        'X-RateLimit-Reset': str(time.time() + reset_in),
+    }
+    headers.update(kwargs.pop('headers', {}))
+    return httpx.Response(200, headers=headers, **kwargs)
+
+
+def commit(sha: str = 'abcdef1234567890') -> dict:
+    return {
+        'sha': sha,
+        'html_url': f'https://github.com/o/r/commit/{sha}',
+        'commit': {
+            'message': 'Subject line\n\nBody',
+            'author': {'name': 'octocat', 'date': '2026-01-01T00:00:00Z'},
+        },
+    }
+
+
+def test_fresh_response_is_served_from_cache(github):
+    async def run():
+        first = await github_toolset._get_json('/repos/o/r', params={'a': 1})
+        second = await github_toolset._get_json('/repos/o/r', params={'a': 1})
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second == {'items': []}
+    assert len(github.requests) == 1
+
+
+def test_expired_response_is_revalidated_with_etag(github):
+    github.handler = lambda request: (
+        httpx.Response(304)
+        if request.headers.get('If-None-Match') == '"v1"'
+        else httpx.Response(200, json={'items': [1]}, headers={'ETag': '"v1"'})
+    )
+
+    async def run():
+        await github_toolset._get_json('/repos/o/r')
+        github_toolset._fresh_cache.clear()
+        return await github_toolset._get_json('/repos/o/r')
+
+    assert asyncio.run(run()) == {'items': [1]}
+    assert [r.headers.get('If-None-Match') for r in github.requests] == [None, '"v1"']
+
+
+def test_expired_entries_do_not_crowd_out_new_keys(github, monkeypatch):
+    # Same cache type as the module uses, shrunk and driven by a fake clock
+    assert isinstance(github_toolset._fresh_cache, TTLCache)
+    now = [0.0]
+    monkeypatch.setattr(
+        github_toolset,
+        '_fresh_cache',
+        TTLCache(maxsize=4, ttl=github_toolset.CACHE_TTL_SECONDS, timer=lambda: now[0]),
+    )
+
+    async def run():
+        for i in range(4):
+            for _ in range(5):
+                await github_toolset._get_json(f'/old/{i}')
+        now[0] = github_toolset.CACHE_TTL_SECONDS + 1
+        await github_toolset._get_json('/new/a')
+        await github_toolset._get_json('/new/b')
+        await github_toolset._get_json('/new/a')
+
+    asyncio.run(run())
+
+    assert [r.url.path for r in github.requests[4:]] == ['/new/a', '/new/b']
+
+
+def test_cache_params_replace_params_in_the_cache_key(github):
+    async def run():
+        await github_toolset._get_json('/repos/o/r/commits', params={'since': '1'}, cache_params={'days': 7})
+        await github_toolset._get_json('/repos/o/r/commits', params={'since': '2'}, cache_params={'days': 7})
+        await github_toolset._get_json('/repos/o/r/commits', params={'since': '3'}, cache_params={'days': 1})
+
+    asyncio.run(run())
+
+    assert len(github.requests) == 2
+
+
+def test_cache_key_includes_credentials(github):
+    async def run():
+        await github_toolset._get_json('/repos/o/r')
+        github_toolset.get_client().headers['Authorization'] = 'Bearer other-token'
+        github_toolset._auth_id.cache_clear()
+        await github_toolset._get_json('/repos/o/r')
+
+    asyncio.run(run())
+
+    assert len(github.requests) == 2
+
+
+def test_concurrent_identical_requests_share_one_fetch(github):
+    async def slow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={'items': []})
+
+    github.handler = slow
+
+    async def run():
+        return await asyncio.gather(*(github_toolset._get_json('/search/repositories') for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert len(results) == 5
+    assert len(github.requests) == 1
+    assert github_toolset._inflight == {}
+
+
+def test_stale_body_is_served_while_rate_limited(github):
+    github.handler = lambda request: rate_limited('core', 3000, json=[commit()])
+
+    async def run():
+        first = await github_toolset._get_json('/repos/o/r/commits')
+        github_toolset._fresh_cache.clear()
+        second = await github_toolset._get_json('/repos/o/r/commits')
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert len(github.requests) == 1
+
+
+def test_fails_fast_when_reset_is_beyond_wait_budget(github):
+    github.handler = lambda request: rate_limited('search', 3000, json={'items': []})
+    toolset = GitHubToolset()
+
+    async def run():
+        await toolset.search_repositories('first')
+        started = time.monotonic()
+        result = await toolset.search_repositories('second')
+        return result, time.monotonic() - started
+
+    result, elapsed = asyncio.run(run())
+
+    assert result['status'] == 'error'
+    assert 'rate limit exceeded' in result['error_message']
+    assert elapsed < 1
+    assert len(github.requests) == 1
+
+
+def test_waits_when_reset_is_within_wait_budget(github):
+    responses = iter([
+        rate_limited('search', 0.2, json={'items': []}),
+        httpx.Response(200, json={'items': []}),
+    ])
+    github.handler = lambda request: next(responses)
+    toolset = GitHubToolset()
+
+    async def run():
+        await toolset.search_repositories('first')
+        return await toolset.search_repositories('second')
+
+    assert asyncio.run(run())['status'] == 'success'
+    assert len(github.requests) == 2
+
+
+def test_exhausted_search_limit_does_not_gate_core_requests(github):
+    github.handler = lambda request: (
+        rate_limited('search', 3000, json={'items': []})
+        if request.url.path.startswith('/search/')
+        else httpx.Response(200, json=[commit()])
+    )
+    toolset = GitHubToolset()
+
+    async def run():
+        await toolset.search_repositories('python')
+        return await toolset.get_recent_commits('o/r')
+
+    result = asyncio.run(run())
+
+    assert result['status'] == 'success'
+    assert result['data'][0].message == 'Subject line'
+    assert result['data'][0].sha == 'abcdef12'
+
+
+@pytest.mark.parametrize('limit', [0, -1])
+def test_non_positive_limit_is_rejected(github, limit):
+    result = asyncio.run(GitHubToolset().get_recent_commits('o/r', limit=limit))
+
+    assert result['status'] == 'error'
+    assert github.requests == []
+
+
+def test_limit_is_capped_at_one_page(github):
+    github.handler = lambda request: httpx.Response(200, json=[commit()] * 100)
+
+    result = asyncio.run(GitHubToolset().get_recent_commits('o/r', limit=500))
+
+    assert result['count'] == 100
+    assert 'capped at 100' in result['message']
+    assert github.requests[0].url.params['per_page'] == '100'